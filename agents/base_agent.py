@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 class BaseAgent(ABC):
     def __init__(self, name: str, client: Any):
@@ -7,11 +7,25 @@ class BaseAgent(ABC):
         self.client = client
 
     @abstractmethod
+    def build_prompts(self, inputs: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Builds the (system_prompt, user_prompt) pair for the given inputs.
+        """
+        pass
+
     def analyze(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyzes the inputs and returns a structured dictionary.
         """
-        pass
+        system_prompt, user_prompt = self.build_prompts(inputs)
+        return self.client.generate(system_prompt, user_prompt)
+
+    async def analyze_async(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Same as analyze, but awaits the LLM call instead of blocking the event loop.
+        """
+        system_prompt, user_prompt = self.build_prompts(inputs)
+        return await self.client.generate_async(system_prompt, user_prompt)
 
     def format_prompt(self, template: str, **kwargs) -> str:
         """
@@ -1,12 +1,12 @@
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from agents.base_agent import BaseAgent
 
 class CoordinatorAgent(BaseAgent):
     def __init__(self, client: Any):
         super().__init__("Coordinator Agent", client)
 
-    def analyze(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    def build_prompts(self, inputs: Dict[str, Any]) -> Tuple[str, str]:
         """
         Synthesizes the final decision based on all agent outputs and the case data.
         """
@@ -14,6 +14,7 @@ class CoordinatorAgent(BaseAgent):
         case_data = inputs.get("initial_inputs", {})
         round1_outputs = inputs.get("round1", {})
         round2_outputs = inputs.get("round2", {})
+        rule_decision = inputs.get("rule_decision")
         
         system_prompt = """
         You are the Coordinator Agent.
@@ -50,7 +51,14 @@ class CoordinatorAgent(BaseAgent):
         {json.dumps(round2_outputs, indent=2)}
         """
 
-        return self.client.generate(system_prompt, user_prompt)
+        # The decision gate already applied the System Rules; only a narrative is needed.
+        if rule_decision:
+            user_prompt += f"""
+        The System Rules already fixed final_decision = "{rule_decision['final_decision']}"
+        ({rule_decision['reasoning_summary']}). Do not change it; explain it in plain language.
+        """
+
+        return system_prompt, user_prompt
 
     # synthesize method removed as it is superseded by analyze
 
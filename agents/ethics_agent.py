@@ -1,12 +1,12 @@
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from agents.base_agent import BaseAgent
 
 class EthicsSafetyAgent(BaseAgent):
     def __init__(self, client: Any):
         super().__init__("Ethics & Safety Agent", client)
 
-    def analyze(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    def build_prompts(self, inputs: Dict[str, Any]) -> Tuple[str, str]:
         """
         Analyzes the inputs for ethical and safety violations.
         Can be used in Round 1 (initial check) or Round 2 (reviewing other agents).
@@ -36,4 +36,4 @@ class EthicsSafetyAgent(BaseAgent):
         {json.dumps(inputs, indent=2)}
         """
 
-        return self.client.generate(system_prompt, user_prompt)
+        return system_prompt, user_prompt
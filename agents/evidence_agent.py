@@ -1,12 +1,12 @@
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from agents.base_agent import BaseAgent
 
 class EvidenceQualityAgent(BaseAgent):
     def __init__(self, client: Any):
         super().__init__("Evidence Quality Agent", client)
 
-    def analyze(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    def build_prompts(self, inputs: Dict[str, Any]) -> Tuple[str, str]:
         system_prompt = """
         You are the Evidence Quality Agent.
         Your Goal: Score completeness of inputs. identify missing vitals or unclear descriptions.
@@ -35,4 +35,4 @@ class EvidenceQualityAgent(BaseAgent):
         {json.dumps(inputs, indent=2)}
         """
 
-        return self.client.generate(system_prompt, user_prompt)
+        return system_prompt, user_prompt
@@ -1,12 +1,12 @@
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from agents.base_agent import BaseAgent
 
 class RiskStratificationAgent(BaseAgent):
     def __init__(self, client: Any):
         super().__init__("Risk Stratification Agent", client)
 
-    def analyze(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    def build_prompts(self, inputs: Dict[str, Any]) -> Tuple[str, str]:
         system_prompt = """
         You are the Risk Stratification Agent (The Skeptic).
         Your Goal: Assume the WORST PLAUSIBLE CASE. Penalize optimism.
@@ -29,4 +29,4 @@ class RiskStratificationAgent(BaseAgent):
         {json.dumps(inputs, indent=2)}
         """
 
-        return self.client.generate(system_prompt, user_prompt)
+        return system_prompt, user_prompt
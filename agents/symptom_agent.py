@@ -1,12 +1,12 @@
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from agents.base_agent import BaseAgent
 
 class SymptomInterpretationAgent(BaseAgent):
     def __init__(self, client: Any):
         super().__init__("Symptom Interpretation Agent", client)
 
-    def analyze(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    def build_prompts(self, inputs: Dict[str, Any]) -> Tuple[str, str]:
         system_prompt = """
         You are the Symptom Interpretation Agent.
         Your Goal: Extract structured symptoms and detect RED FLAGS.
@@ -32,4 +32,4 @@ class SymptomInterpretationAgent(BaseAgent):
         Identify symptoms and red flags.
         """
 
-        return self.client.generate(system_prompt, user_prompt)
+        return system_prompt, user_prompt
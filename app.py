@@ -1,19 +1,19 @@
 import streamlit as st
 import os
-import io
-import contextlib
-import re
 from dotenv import load_dotenv
 from core.triage_system import TriageSystem
+from core.events import FINAL_DECISION, format_event
+from utils.response_cache import build_response_cache
 
 # Load env
 load_dotenv()
 
 st.set_page_config(page_title="Medical Triage System", page_icon="🏥", layout="wide")
 
-def strip_ansi(text):
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+@st.cache_resource
+def get_triage_system(api_key):
+    """One TriageSystem per API key, shared across reruns and sessions."""
+    return TriageSystem(api_key=api_key, cache=build_response_cache(os.getenv("TRIAGE_CACHE", "memory")))
 
 st.title("🏥 Multi-Agent Medical Triage System")
 st.markdown("---")
@@ -46,7 +46,7 @@ if st.button("Run Triage Analysis", type="primary", use_container_width=True):
         # Initialize System
         try:
             with st.spinner("Initializing Agents..."):
-                system = TriageSystem(api_key=api_key)
+                system = get_triage_system(api_key)
             
             inputs = {
                 "symptoms": symptoms,
@@ -56,24 +56,26 @@ if st.button("Run Triage Analysis", type="primary", use_container_width=True):
 
             st.info("🤖 Agents are deliberating... Please wait.")
 
-            # Capture stdout to show the "thinking" process
-            f = io.StringIO()
-            result = None
-            
-            with contextlib.redirect_stdout(f):
-                try:
-                     result = system.run_simulation(inputs)
-                except Exception as e:
-                    st.error(f"Error during simulation: {e}")
-            
-            logs = strip_ansi(f.getvalue())
-            
             # Layout for results
             res_col1, res_col2 = st.columns([1, 1])
 
             with res_col1:
                 st.subheader("📋 Agent Deliberation Logs")
-                st.code(logs, language="text", line_numbers=True)
+                log_panel = st.empty()
+
+            # Render each agent result as soon as it arrives
+            result = None
+            log_lines = []
+            try:
+                for event in system.stream_simulation(inputs):
+                    line = format_event(event)
+                    if line and event.type != FINAL_DECISION:
+                        log_lines.append(line)
+                        log_panel.code("\n".join(log_lines), language="text", line_numbers=True)
+                    if event.type == FINAL_DECISION:
+                        result = event["result"]
+            except Exception as e:
+                st.error(f"Error during simulation: {e}")
 
             with res_col2:
                 if result:
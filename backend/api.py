@@ -1,6 +1,9 @@
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+import json
 import os
 import sys
 
@@ -8,11 +11,28 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.triage_system import TriageSystem
+from core.events import ERROR, make_event
+from core.batch import parse_case, run_batch_async
+from utils.response_cache import build_response_cache
 from dotenv import load_dotenv
 
 load_dotenv()
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One TriageSystem (and one warm connection pool) for the whole process.
+    api_key = os.getenv("OPENAI_API_KEY")
+    app.state.triage_system = TriageSystem(
+        api_key=api_key,
+        cache=build_response_cache(os.getenv("TRIAGE_CACHE", "memory"))
+    ) if api_key else None
+    try:
+        yield
+    finally:
+        if app.state.triage_system:
+            await app.state.triage_system.aclose()
+
+app = FastAPI(lifespan=lifespan)
 
 # Allow CORS for React app
 app.add_middleware(
@@ -28,26 +48,87 @@ class TriageRequest(BaseModel):
     age: str
     history: str
 
+def get_triage_system(request: Request) -> TriageSystem:
+    system = request.app.state.triage_system
+    if system is None:
+        raise HTTPException(status_code=500, detail="API Key not found in environment")
+    return system
+
 @app.post("/api/triage")
-async def run_triage(request: TriageRequest):
+async def run_triage(request: TriageRequest, system: TriageSystem = Depends(get_triage_system)):
     try:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise HTTPException(status_code=500, detail="API Key not found in environment")
-            
-        system = TriageSystem(api_key=api_key)
-        
         inputs = {
             "symptoms": request.symptoms,
             "age": request.age,
             "history": request.history
         }
-        
-        result = system.run_simulation(inputs)
+
+        result = await system.run_simulation_async(inputs)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def format_sse(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+@app.post("/api/triage/stream")
+async def stream_triage(request: TriageRequest, system: TriageSystem = Depends(get_triage_system)):
+    """
+    Same deliberation as /api/triage, pushed to the client as Server-Sent Events
+    while it happens. The last event is either final_decision or error.
+    """
+    inputs = {
+        "symptoms": request.symptoms,
+        "age": request.age,
+        "history": request.history
+    }
+
+    async def event_source():
+        try:
+            async for event in system.stream_simulation_async(inputs):
+                yield format_sse(event)
+        except Exception as e:
+            yield format_sse(make_event(ERROR, detail=str(e)))
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/api/triage/batch")
+async def batch_triage(
+    request: Request,
+    concurrency: int = Query(8, ge=1, le=64),
+    system: TriageSystem = Depends(get_triage_system)
+):
+    """
+    Bulk triage. The request body is JSONL, one case per line ({"id", "symptoms",
+    "age", "history"}); it is read incrementally, and one JSON line per finished
+    case ({"id", "result"} or {"id", "error"}) is streamed back as it completes.
+    """
+    async def cases():
+        buffer = b""
+        line_number = 0
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                line_number += 1
+                if line.strip():
+                    yield parse_case(line.decode("utf-8"), line_number)
+        if buffer.strip():
+            yield parse_case(buffer.decode("utf-8"), line_number + 1)
+
+    async def results():
+        try:
+            async for record in run_batch_async(system, cases(), max_concurrency=concurrency):
+                yield json.dumps(record) + "\n"
+        except Exception as e:
+            yield json.dumps({"error": str(e)}) + "\n"
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,151 @@
+import asyncio
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Optional, Set, Tuple
+from core.events import FINAL_DECISION
+
+CASE_FIELDS = ("symptoms", "age", "history")
+
+def parse_case(line: str, line_number: int) -> Tuple[str, Dict[str, Any]]:
+    """
+    Parses one JSONL case into (case_id, inputs). Cases without an "id" are
+    identified by their 1-based line number, which stays stable across resumes.
+    """
+    record = json.loads(line)
+    case_id = str(record.get("id", line_number))
+    inputs = {field: record.get(field, "") for field in CASE_FIELDS}
+    return case_id, inputs
+
+def read_cases(path: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Streams cases from a JSONL file without loading it into memory.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if line.strip():
+                yield parse_case(line, line_number)
+
+def completed_case_ids(output_path: str) -> Set[str]:
+    """
+    Case ids that already have a result in the output file. Failed cases are
+    not counted, so a resumed run retries them.
+    """
+    done: Set[str] = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A run killed mid-write can leave a truncated last line
+                continue
+            if "result" in record:
+                done.add(str(record["id"]))
+    return done
+
+def triage_case(system: Any, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Runs one case without the console log, which would drown a bulk run.
+    """
+    for event in system.stream_simulation(inputs):
+        if event.type == FINAL_DECISION:
+            return event["result"]
+    raise RuntimeError("Deliberation ended without a final decision")
+
+async def triage_case_async(system: Any, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    async for event in system.stream_simulation_async(inputs):
+        if event.type == FINAL_DECISION:
+            return event["result"]
+    raise RuntimeError("Deliberation ended without a final decision")
+
+def _record(case_id: str, result: Optional[Dict[str, Any]] = None, error: Optional[Exception] = None) -> Dict[str, Any]:
+    if error is not None:
+        return {"id": case_id, "error": str(error)}
+    return {"id": case_id, "result": result}
+
+def run_batch(
+    system: Any,
+    cases: Iterable[Tuple[str, Dict[str, Any]]],
+    output_path: str,
+    max_concurrency: int = 8,
+    resume: bool = True
+) -> Dict[str, int]:
+    """
+    Triage every case with at most max_concurrency cases in flight, appending
+    one JSON line per finished case to output_path (flushed immediately, so the
+    file doubles as the checkpoint). With resume, cases already in the output
+    are skipped. Returns counts of completed, failed and skipped cases.
+    """
+    done = completed_case_ids(output_path) if resume else set()
+    summary = {"completed": 0, "failed": 0, "skipped": 0}
+    max_concurrency = max(1, max_concurrency)
+
+    with open(output_path, "a" if resume else "w", encoding="utf-8") as out, \
+            ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        pending = {}
+
+        def drain(return_when):
+            finished, _ = wait(pending, return_when=return_when)
+            for future in finished:
+                case_id = pending.pop(future)
+                try:
+                    record = _record(case_id, result=future.result())
+                    summary["completed"] += 1
+                except Exception as e:
+                    record = _record(case_id, error=e)
+                    summary["failed"] += 1
+                out.write(json.dumps(record) + "\n")
+                out.flush()
+
+        for case_id, inputs in cases:
+            if case_id in done:
+                summary["skipped"] += 1
+                continue
+            # Keep the input side lazy: never queue more than the pool can run
+            if len(pending) >= max_concurrency:
+                drain(FIRST_COMPLETED)
+            pending[executor.submit(triage_case, system, inputs)] = case_id
+
+        while pending:
+            drain(FIRST_COMPLETED)
+
+    return summary
+
+async def run_batch_async(
+    system: Any,
+    cases: AsyncIterator[Tuple[str, Dict[str, Any]]],
+    max_concurrency: int = 8
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Async counterpart of run_batch for the API: yields one record per case in
+    completion order, with at most max_concurrency cases in flight.
+    """
+    max_concurrency = max(1, max_concurrency)
+    pending: Dict[asyncio.Task, str] = {}
+
+    async def finished_records(return_when):
+        finished, _ = await asyncio.wait(pending, return_when=return_when)
+        records = []
+        for task in finished:
+            case_id = pending.pop(task)
+            try:
+                records.append(_record(case_id, result=task.result()))
+            except Exception as e:
+                records.append(_record(case_id, error=e))
+        return records
+
+    try:
+        async for case_id, inputs in cases:
+            if len(pending) >= max_concurrency:
+                for record in await finished_records(asyncio.FIRST_COMPLETED):
+                    yield record
+            pending[asyncio.ensure_future(triage_case_async(system, inputs))] = case_id
+
+        while pending:
+            for record in await finished_records(asyncio.FIRST_COMPLETED):
+                yield record
+    finally:
+        for task in pending:
+            task.cancel()
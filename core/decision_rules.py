@@ -0,0 +1,110 @@
+from typing import Any, Dict, List, Optional
+
+# Thresholds from the Coordinator's system rules.
+MIN_CONFIDENCE = 40
+MAX_DISAGREEMENT = 50
+CONSULT_RISK = 70
+
+# Evidence Quality reports missing information as "red_flags" and always scores
+# risk 0, so it only contributes to the confidence column.
+CLINICAL_AGENTS = ("symptom", "risk", "ethics")
+
+NEXT_STEPS = {
+    "URGENT": [
+        "Seek emergency care now (call your local emergency number or go to the nearest ER).",
+        "Do not drive yourself if symptoms are severe."
+    ],
+    "REFUSED": [
+        "This case cannot be triaged safely by an automated system.",
+        "Please speak to a licensed clinician directly."
+    ],
+    "CONSULT": [
+        "Book an appointment with a doctor within the next 24-48 hours.",
+        "Seek urgent care if symptoms get worse."
+    ]
+}
+
+def _numbers(outputs: List[Dict[str, Any]], field: str) -> List[float]:
+    values = []
+    for output in outputs:
+        value = output.get(field)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            values.append(float(value))
+    return values
+
+def _dedupe(flags: List[Any]) -> List[str]:
+    seen = {}
+    for flag in flags:
+        if isinstance(flag, str) and flag.strip():
+            seen.setdefault(flag.strip().lower(), flag.strip())
+    return list(seen.values())
+
+def collect_red_flags(round1_outputs: Dict[str, Any], round2_outputs: Dict[str, Any]) -> List[str]:
+    """
+    Clinical red flags raised in Round 1 plus any the Round 2 risk review added.
+    """
+    flags: List[Any] = []
+    for key in CLINICAL_AGENTS:
+        flags.extend(round1_outputs.get(key, {}).get("red_flags") or [])
+    flags.extend(round2_outputs.get("risk_review", {}).get("red_flags") or [])
+    return _dedupe(flags)
+
+def compute_metrics(round1_outputs: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """
+    Scores the Coordinator rules are defined over, computed column-wise across agents.
+    """
+    all_agents = list(round1_outputs.values())
+    clinical = [round1_outputs[key] for key in CLINICAL_AGENTS if key in round1_outputs]
+
+    confidences = _numbers(all_agents, "confidence")
+    risks = _numbers(clinical, "risk_score")
+    return {
+        "avg_confidence": sum(confidences) / len(confidences) if confidences else None,
+        "avg_risk": sum(risks) / len(risks) if risks else None,
+        "disagreement": max(risks) - min(risks) if len(risks) > 1 else 0.0
+    }
+
+def _confidence_level(avg_confidence: Optional[float]) -> str:
+    if avg_confidence is None or avg_confidence < MIN_CONFIDENCE:
+        return "Low"
+    return "High" if avg_confidence >= 70 else "Medium"
+
+def evaluate_rules(round1_outputs: Dict[str, Any], round2_outputs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Applies the Coordinator's hard rules locally. Returns a complete final decision
+    when a rule fires decisively, or None when the case needs the Coordinator LLM
+    (no rule fired, i.e. the SELF-CARE fallthrough, or an agent call failed).
+    """
+    outputs = list(round1_outputs.values()) + list(round2_outputs.values())
+    if any(not isinstance(output, dict) or "error" in output for output in outputs):
+        return None
+
+    metrics = compute_metrics(round1_outputs)
+    red_flags = collect_red_flags(round1_outputs, round2_outputs)
+    veto = bool(round2_outputs.get("ethics_review", {}).get("veto", False))
+
+    # Same precedence as the Coordinator prompt; red flags win over a veto so a
+    # possible emergency is never answered with a refusal.
+    if red_flags:
+        decision, rule, reason = "URGENT", "red_flags", f"Red flags identified: {', '.join(red_flags)}."
+    elif veto:
+        decision, rule, reason = "REFUSED", "ethics_veto", "The Ethics & Safety review vetoed an automated decision."
+    elif metrics["avg_confidence"] is not None and metrics["avg_confidence"] < MIN_CONFIDENCE:
+        decision, rule, reason = "REFUSED", "low_confidence", f"Average agent confidence is {metrics['avg_confidence']:.0f}%, below {MIN_CONFIDENCE}%."
+    elif metrics["disagreement"] > MAX_DISAGREEMENT:
+        decision, rule, reason = "REFUSED", "disagreement", f"Agents disagree on risk by {metrics['disagreement']:.0f} points, above {MAX_DISAGREEMENT}."
+    elif metrics["avg_risk"] is not None and metrics["avg_risk"] > CONSULT_RISK:
+        decision, rule, reason = "CONSULT", "high_risk", f"Average risk score is {metrics['avg_risk']:.0f}%, above {CONSULT_RISK}%."
+    else:
+        return None
+
+    return {
+        "final_decision": decision,
+        "reasoning_summary": reason,
+        "safety_notes": red_flags,
+        "confidence_level": "High" if decision == "URGENT" else _confidence_level(metrics["avg_confidence"]),
+        "next_steps": list(NEXT_STEPS[decision]),
+        "decision_source": "rules",
+        "rule": rule,
+        "metrics": metrics
+    }
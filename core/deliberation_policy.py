@@ -0,0 +1,53 @@
+from typing import Any, Dict, Optional
+
+# Agents whose triage_level is a clinical opinion (Evidence Quality reports "unknown" by design).
+VOTING_AGENTS = ("symptom", "risk", "ethics")
+
+class DeliberationPolicy:
+    """
+    Decides from Round 1 alone whether the Round 2 risk/ethics reviews can change
+    the outcome. mode="always" keeps the full protocol; mode="adaptive" skips
+    Round 2 only for clear-cut cases:
+
+    - unanimous_urgent: every voting agent says urgent and at least one red flag
+      was raised. URGENT is already the most cautious outcome, so neither a new
+      flag nor a veto could make it safer.
+    - confident_agreement: every voting agent agrees on consult/urgent with at
+      least `agreement_confidence`. Self-care is never fast-tracked, because the
+      ethics review is what catches unsafe reassurance.
+
+    A Round 1 veto or a failed agent call always forces the full protocol.
+    """
+    def __init__(self, mode: str = "adaptive", agreement_confidence: int = 80):
+        if mode not in ("always", "adaptive"):
+            raise ValueError(f"Unknown deliberation mode: {mode}")
+        self.mode = mode
+        self.agreement_confidence = agreement_confidence
+
+    def skip_round2_reason(self, round1_outputs: Dict[str, Any]) -> Optional[str]:
+        """
+        Returns why Round 2 can be skipped, or None if it must run.
+        """
+        if self.mode == "always":
+            return None
+        if any(not isinstance(output, dict) or "error" in output for output in round1_outputs.values()):
+            return None
+        if round1_outputs.get("ethics", {}).get("veto", False):
+            return None
+
+        voters = [round1_outputs.get(key, {}) for key in VOTING_AGENTS]
+        levels = {str(voter.get("triage_level", "unknown")).lower() for voter in voters}
+        if len(levels) != 1:
+            return None
+        level = levels.pop()
+
+        if level == "urgent" and any(voter.get("red_flags") for voter in voters):
+            return "unanimous_urgent"
+
+        confidences = [voter.get("confidence") for voter in voters]
+        if level in ("consult", "urgent") and all(
+            isinstance(confidence, (int, float)) and confidence >= self.agreement_confidence
+            for confidence in confidences
+        ):
+            return "confident_agreement"
+        return None
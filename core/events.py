@@ -0,0 +1,61 @@
+from typing import Any, Dict, Optional
+
+# Event types emitted while a case is deliberated, in the order they can occur.
+ROUND_START = "round_start"
+ROUND_SKIPPED = "round_skipped"
+AGENT_RESULT = "agent_result"
+VETO = "veto"
+RULE_DECISION = "rule_decision"
+FINAL_DECISION = "final_decision"
+# Only emitted by transports (e.g. the SSE endpoint) when a run fails mid-stream.
+ERROR = "error"
+
+class TriageEvent(dict):
+    """
+    A structured progress event. It is a plain dict underneath, so it can be
+    sent to clients with json.dumps as-is.
+    """
+    @property
+    def type(self) -> str:
+        return self["type"]
+
+def make_event(event_type: str, **fields: Any) -> TriageEvent:
+    return TriageEvent(type=event_type, **fields)
+
+ROUND_TITLES = {
+    1: "Independent Analysis",
+    2: "Challenge & Dissent",
+    3: "Decision Gate"
+}
+
+def format_event(event: Dict[str, Any]) -> Optional[str]:
+    """
+    Plain-text log line for an event, or None if the event is not worth a line.
+    Shared by the CLI printer and the Streamlit log panel.
+    """
+    event_type = event["type"]
+    if event_type == ROUND_START:
+        return f"🌀 ROUND {event['round']}: {ROUND_TITLES[event['round']]}"
+    if event_type == ROUND_SKIPPED:
+        return f"🌀 ROUND {event['round']}: Skipped ({event['reason']})"
+    if event_type == VETO:
+        return "ETHICS VETO TRIGGERED"
+    if event_type == RULE_DECISION:
+        return f"⚡ RULE GATE: {event['decision']} ({event['rule']})"
+    if event_type == FINAL_DECISION:
+        return f"🏆 FINAL DECISION: {event['result']}"
+    if event_type == AGENT_RESULT:
+        agent, result = event["agent"], event["result"]
+        if agent == "symptom":
+            return f"Symptom Agent: {result.get('triage_level', 'Unknown')}"
+        if agent == "risk":
+            return f"Risk Agent: {result.get('triage_level', 'Unknown')}"
+        if agent == "evidence":
+            return f"Evidence Agent: Confidence {result.get('confidence', 0)}%"
+        if agent == "ethics":
+            return f"Ethics Agent: {result.get('triage_level', 'Unknown')}"
+        if agent == "risk_review":
+            return f"Risk Agent Review: {result.get('red_flags', [])}"
+        if agent == "ethics_review":
+            return f"Ethics Agent Review: Veto? {result.get('veto', False)}"
+    return None
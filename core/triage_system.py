@@ -1,11 +1,20 @@
+import asyncio
 import json
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, AsyncIterator, Generator, Iterator, List, Optional, Tuple, Union
 from agents.symptom_agent import SymptomInterpretationAgent
 from agents.risk_agent import RiskStratificationAgent
 from agents.evidence_agent import EvidenceQualityAgent
 from agents.ethics_agent import EthicsSafetyAgent
 from agents.coordinator_agent import CoordinatorAgent
 from utils.llm_client import LLMClient
+from utils.response_cache import ResponseCache
+from core.decision_rules import evaluate_rules
+from core.deliberation_policy import DeliberationPolicy
+from core.events import (
+    AGENT_RESULT, FINAL_DECISION, ROUND_SKIPPED, ROUND_START, RULE_DECISION, VETO,
+    TriageEvent, format_event, make_event
+)
 import colorama
 from colorama import Fore, Style
 
@@ -14,9 +23,39 @@ colorama.init()
 from core.doctors_data import DOCTOR_DATABASE
 import random
 
+class AgentCalls:
+    """
+    One step of the deliberation plan: independent agent calls for a round,
+    keyed by the name their result is reported under.
+    """
+    def __init__(self, round_number: int, calls: Dict[str, Tuple[Any, Dict[str, Any]]]):
+        self.round = round_number
+        self.calls = calls
+
 class TriageSystem:
-    def __init__(self, api_key: str):
-        self.client = LLMClient(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        max_concurrency: int = 4,
+        client: Optional[LLMClient] = None,
+        cache: Optional[ResponseCache] = None,
+        rule_fast_path: bool = True,
+        narrate_rule_decisions: bool = False,
+        deliberation_policy: Optional[DeliberationPolicy] = None
+    ):
+        # Upper bound on agent calls in flight at once within a round.
+        # 1 disables the thread pool and runs agents one after another.
+        self.max_concurrency = max(1, max_concurrency)
+        # All agents share one client, and therefore one connection pool.
+        # An optional response cache makes repeat cases (and their Round 2 /
+        # coordinator prompts, which are built from Round 1) free.
+        self.client = client or LLMClient(api_key=api_key, cache=cache)
+        # When the System Rules decide a case on their own, skip the Coordinator
+        # call entirely, or (narrate_rule_decisions) use it only for the summary.
+        self.rule_fast_path = rule_fast_path
+        self.narrate_rule_decisions = narrate_rule_decisions
+        # Decides per case whether Round 2 is worth its two LLM calls
+        self.deliberation_policy = deliberation_policy or DeliberationPolicy()
         self.symptom_agent = SymptomInterpretationAgent(self.client)
         self.risk_agent = RiskStratificationAgent(self.client)
         self.evidence_agent = EvidenceQualityAgent(self.client)
@@ -31,6 +70,12 @@ class TriageSystem:
             self.ethics_agent
         ]
 
+    def close(self) -> None:
+        self.client.close()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
     def _get_doctor_recommendations(self, decision: str, symptoms: str):
         """Simple keyword matching to recommend relevant specialists."""
         recommendations = []
@@ -73,51 +118,93 @@ class TriageSystem:
 
         return recommendations[:3]
 
-    def run_simulation(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
-        print(Fore.CYAN + "🌀 ROUND 1: Independent Analysis" + Style.RESET_ALL)
+    def _iter_parallel(self, calls: Dict[str, Tuple[Any, Dict[str, Any]]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Runs independent agent calls concurrently, bounded by max_concurrency,
+        yielding (key, result) pairs as soon as each call finishes.
+        """
+        workers = min(self.max_concurrency, len(calls))
+        if workers <= 1:
+            for key, (agent, agent_inputs) in calls.items():
+                yield key, agent.analyze(agent_inputs)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(agent.analyze, agent_inputs): key
+                for key, (agent, agent_inputs) in calls.items()
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    async def _iter_parallel_async(self, calls: Dict[str, Tuple[Any, Dict[str, Any]]]) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Async counterpart of _iter_parallel: runs the calls on the event loop
+        with at most max_concurrency of them awaiting the LLM.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(key, agent, agent_inputs):
+            async with semaphore:
+                return key, await agent.analyze_async(agent_inputs)
+
+        tasks = [asyncio.ensure_future(bounded(key, agent, agent_inputs)) for key, (agent, agent_inputs) in calls.items()]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Only does anything if the consumer stopped listening mid-round
+            for task in tasks:
+                task.cancel()
+
+    def _deliberate(self, inputs: Dict[str, Any]) -> Generator[Union[AgentCalls, TriageEvent], Optional[Dict[str, Dict[str, Any]]], None]:
+        """
+        The deliberation protocol, independent of how agent calls are executed.
+        Yields progress events, and AgentCalls batches whose results are sent
+        back in, so the sync and async drivers share one implementation.
+        Results are always read by key, so the case outcome does not depend
+        on which agent finished first.
+        """
+        yield make_event(ROUND_START, round=1)
         
         # Round 1: Parallel Analysis
-        symptom_analysis = self.symptom_agent.analyze(inputs)
-        print(f"Symptom Agent: {symptom_analysis.get('triage_level', 'Unknown')}")
-        
-        risk_analysis = self.risk_agent.analyze(inputs)
-        print(f"Risk Agent: {risk_analysis.get('triage_level', 'Unknown')}")
-        
-        evidence_analysis = self.evidence_agent.analyze(inputs)
-        print(f"Evidence Agent: Confidence {evidence_analysis.get('confidence', 0)}%")
-        
-        ethics_analysis = self.ethics_agent.analyze(inputs)
-        print(f"Ethics Agent: {ethics_analysis.get('triage_level', 'Unknown')}")
-
+        round1_results = yield AgentCalls(1, {
+            "symptom": (self.symptom_agent, inputs),
+            "risk": (self.risk_agent, inputs),
+            "evidence": (self.evidence_agent, inputs),
+            "ethics": (self.ethics_agent, inputs)
+        })
         round1_outputs = {
-            "symptom": symptom_analysis,
-            "risk": risk_analysis,
-            "evidence": evidence_analysis,
-            "ethics": ethics_analysis
+            "symptom": round1_results["symptom"],
+            "risk": round1_results["risk"],
+            "evidence": round1_results["evidence"],
+            "ethics": round1_results["ethics"]
         }
 
-        print(Fore.CYAN + "\n🌀 ROUND 2: Challenge & Dissent" + Style.RESET_ALL)
-        # Simplified Round 2: Agents review the aggregated state (conceptually). 
-        # For this implementation, we will do a second pass if disagreement is high or risk is borderline.
-        # But per the prompt, Risk/Evidence/Ethics should challenge.
-        # We can simulate this by passing R1 outputs to Ethics/Risk for a "review".
-        
-        # Risk Review
-        risk_review_prompt = f"Review these outputs: {json.dumps(round1_outputs)}. Identify missed risks."
-        risk_review = self.risk_agent.analyze({"review_target": round1_outputs})
-        print(f"Risk Agent Review: {risk_review.get('red_flags', [])}")
-        
-        # Ethics Review
-        ethics_review_prompt = f"Review these outputs: {json.dumps(round1_outputs)}. Veto if unsafe."
-        ethics_review = self.ethics_agent.analyze({"review_target": round1_outputs})
-        print(f"Ethics Agent Review: Veto? {ethics_review.get('veto', False)}")
-
-        round2_outputs = {
-           "risk_review": risk_review,
-           "ethics_review": ethics_review
-        }
+        skip_reason = self.deliberation_policy.skip_round2_reason(round1_outputs)
+        if skip_reason:
+            yield make_event(ROUND_SKIPPED, round=2, reason=skip_reason)
+            round2_outputs = {}
+            ethics_review = {}
+        else:
+            yield make_event(ROUND_START, round=2)
+            # Simplified Round 2: Agents review the aggregated state (conceptually). 
+            # For this implementation, we will do a second pass if disagreement is high or risk is borderline.
+            # But per the prompt, Risk/Evidence/Ethics should challenge.
+            # We can simulate this by passing R1 outputs to Ethics/Risk for a "review".
+            
+            # Risk and Ethics reviews only depend on Round 1, so they run side by side.
+            round2_results = yield AgentCalls(2, {
+                "risk_review": (self.risk_agent, {"review_target": round1_outputs}),
+                "ethics_review": (self.ethics_agent, {"review_target": round1_outputs})
+            })
+            ethics_review = round2_results["ethics_review"]
+            round2_outputs = {
+               "risk_review": round2_results["risk_review"],
+               "ethics_review": ethics_review
+            }
 
-        print(Fore.CYAN + "\n🌀 ROUND 3: Decision Gate" + Style.RESET_ALL)
+        yield make_event(ROUND_START, round=3)
         
         # Combine everything for Coordinator
         final_context = {
@@ -126,18 +213,27 @@ class TriageSystem:
             "round2": round2_outputs
         }
         
-        # System Rules Hard Checks (Pre-computation for Coordinator context)
-        # 1. Red Flags
-        all_red_flags = []
-        for key, val in round1_outputs.items():
-            if isinstance(val, dict):
-                all_red_flags.extend(val.get('red_flags', []))
-        
         if ethics_review.get('veto', False):
-             print(Fore.RED + "ETHICS VETO TRIGGERED" + Style.RESET_ALL)
-        # Round 3: Decision
-        # The original `final_context` is used here to maintain consistency with the coordinator's expected input.
-        final_decision = self.coordinator.analyze(final_context)
+            yield make_event(VETO, round=2, agent="ethics_review", reason=ethics_review.get("refusal_reason"))
+
+        # System Rules Hard Checks: evaluated locally before paying for the Coordinator
+        rule_decision = evaluate_rules(round1_outputs, round2_outputs) if self.rule_fast_path else None
+
+        if rule_decision is None:
+            # Round 3: Decision
+            # The original `final_context` is used here to maintain consistency with the coordinator's expected input.
+            final_decision = dict((yield AgentCalls(3, {"coordinator": (self.coordinator, final_context)}))["coordinator"])
+        else:
+            yield make_event(RULE_DECISION, decision=rule_decision["final_decision"], rule=rule_decision["rule"])
+            final_decision = rule_decision
+            if self.narrate_rule_decisions:
+                narrative = (yield AgentCalls(3, {"coordinator": (self.coordinator, {**final_context, "rule_decision": rule_decision})}))["coordinator"]
+                if "error" not in narrative:
+                    final_decision["reasoning_summary"] = narrative.get("reasoning_summary", final_decision["reasoning_summary"])
+                    final_decision["next_steps"] = narrative.get("next_steps", final_decision["next_steps"])
+                    final_decision["safety_notes"] = final_decision["safety_notes"] + [
+                        note for note in narrative.get("safety_notes", []) if note not in final_decision["safety_notes"]
+                    ]
         
         # [NEW] Append Doctor Recommendations
         recommended_doctors = []
@@ -146,6 +242,86 @@ class TriageSystem:
              recommended_doctors = self._get_doctor_recommendations(decision_str, inputs.get("symptoms", ""))
 
         final_decision["recommended_doctors"] = recommended_doctors
+        final_decision["deliberation"] = {
+            "path": "round1_only" if skip_reason else "full",
+            "reason": skip_reason
+        }
+
+        yield make_event(FINAL_DECISION, result=final_decision)
+
+    def stream_simulation(self, inputs: Dict[str, Any]) -> Iterator[TriageEvent]:
+        """
+        Runs the case and yields each event as it happens: round boundaries,
+        every agent result (in completion order), vetoes, rule decisions and
+        finally a FINAL_DECISION event carrying the full result.
+        """
+        plan = self._deliberate(inputs)
+        results = None
+        while True:
+            try:
+                step = plan.send(results)
+            except StopIteration:
+                return
+            results = None
+            if isinstance(step, AgentCalls):
+                results = {}
+                for key, result in self._iter_parallel(step.calls):
+                    results[key] = result
+                    yield make_event(AGENT_RESULT, round=step.round, agent=key, result=result)
+            else:
+                yield step
+
+    async def stream_simulation_async(self, inputs: Dict[str, Any]) -> AsyncIterator[TriageEvent]:
+        """
+        Async counterpart of stream_simulation, used by the streaming API endpoint.
+        """
+        plan = self._deliberate(inputs)
+        results = None
+        while True:
+            try:
+                step = plan.send(results)
+            except StopIteration:
+                return
+            results = None
+            if isinstance(step, AgentCalls):
+                results = {}
+                async for key, result in self._iter_parallel_async(step.calls):
+                    results[key] = result
+                    yield make_event(AGENT_RESULT, round=step.round, agent=key, result=result)
+            else:
+                yield step
+
+    def _print_event(self, event: TriageEvent) -> None:
+        line = format_event(event)
+        if line is None:
+            return
+        if event.type in (ROUND_START, ROUND_SKIPPED):
+            prefix = "" if event["round"] == 1 else "\n"
+            print(prefix + Fore.CYAN + line + Style.RESET_ALL)
+        elif event.type == VETO:
+            print(Fore.RED + line + Style.RESET_ALL)
+        elif event.type == RULE_DECISION:
+            print(Fore.YELLOW + line + Style.RESET_ALL)
+        elif event.type == FINAL_DECISION:
+            print(f"\n{Fore.GREEN}{line}{Style.RESET_ALL}")
+        else:
+            print(line)
+
+    def run_simulation(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        final_decision = None
+        for event in self.stream_simulation(inputs):
+            self._print_event(event)
+            if event.type == FINAL_DECISION:
+                final_decision = event["result"]
+        return final_decision
 
-        print(f"\n{Fore.GREEN}🏆 FINAL DECISION: {final_decision}{Style.RESET_ALL}")
+    async def run_simulation_async(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Non-blocking run_simulation for async callers such as the FastAPI backend.
+        """
+        final_decision = None
+        async for event in self.stream_simulation_async(inputs):
+            self._print_event(event)
+            if event.type == FINAL_DECISION:
+                final_decision = event["result"]
         return final_decision
@@ -1,13 +1,36 @@
 import sys
 import os
 import json
+import argparse
 from core.triage_system import TriageSystem
+from core.batch import read_cases, run_batch
 import colorama
 from colorama import Fore, Style
 
 colorama.init()
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-agent medical triage")
+    parser.add_argument("--batch", metavar="CASES_JSONL", help="Triage every case in a JSONL file instead of prompting")
+    parser.add_argument("--output", metavar="RESULTS_JSONL", help="Where batch results are appended (default: <cases>.results.jsonl)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Cases in flight at once in batch mode")
+    parser.add_argument("--no-resume", action="store_true", help="Start the output file over instead of skipping finished cases")
+    return parser.parse_args(argv)
+
+def run_bulk(system, args):
+    output = args.output or os.path.splitext(args.batch)[0] + ".results.jsonl"
+    print(f"📦 Batch triage: {args.batch} -> {output} (concurrency {args.concurrency})")
+    summary = run_batch(
+        system,
+        read_cases(args.batch),
+        output,
+        max_concurrency=args.concurrency,
+        resume=not args.no_resume
+    )
+    print(Fore.GREEN + f"✅ Done: {summary['completed']} completed, {summary['failed']} failed, {summary['skipped']} already in output" + Style.RESET_ALL)
+
+def main(argv=None):
+    args = parse_args(argv)
     print(Fore.GREEN + "🏥 MULTI-AGENT MEDICAL TRIAGE SYSTEM 🏥" + Style.RESET_ALL)
     print("--------------------------------------------------")
     
@@ -15,6 +38,9 @@ def main():
     if not api_key:
         print(Fore.YELLOW + "WARNING: OPENAI_API_KEY not found in environment.")
         print("Please set it in .env or environment variables." + Style.RESET_ALL)
+        if args.batch:
+            # Batch runs are unattended; never block on a prompt
+            return
         # Allow user to input key manually
         key_input = input("Enter OpenAI API Key (or press Enter to exit): ").strip()
         if key_input:
@@ -25,6 +51,10 @@ def main():
 
     system = TriageSystem(api_key=api_key)
 
+    if args.batch:
+        run_bulk(system, args)
+        return
+
     while True:
         print("\n📝 NEW CASE ENTRY")
         print("Enter patient details (leave empty to finish entry):")
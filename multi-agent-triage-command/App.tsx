@@ -26,19 +26,45 @@ const App: React.FC = () => {
   const [history, setHistory] = useState('');
   const [result, setResult] = useState<any>(null);
   const [loading, setLoading] = useState(false);
+  const [events, setEvents] = useState<any[]>([]);
+
+  const handleEvent = (event: any) => {
+    if (event.type === 'final_decision') {
+      setResult(event.result);
+    } else if (event.type === 'error') {
+      console.error("Triage Error:", event.detail);
+    }
+    setEvents((previous) => [...previous, event]);
+  };
 
   const runTriage = async () => {
     if (!symptoms || !age) return;
     setLoading(true);
     setResult(null);
+    setEvents([]);
     try {
-      const response = await fetch('http://localhost:8000/api/triage', {
+      // Server-Sent Events over a POST body, so read the stream by hand
+      const response = await fetch('http://localhost:8000/api/triage/stream', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ symptoms, age, history })
       });
-      const data = await response.json();
-      setResult(data);
+      if (!response.body) throw new Error('Streaming not supported');
+
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const frames = buffer.split('\n\n');
+        buffer = frames.pop() ?? '';
+        for (const frame of frames) {
+          const data = frame.split('\n').find((line) => line.startsWith('data: '));
+          if (data) handleEvent(JSON.parse(data.slice(6)));
+        }
+      }
     } catch (error) {
       console.error("Triage Error:", error);
     } finally {
@@ -46,6 +72,18 @@ const App: React.FC = () => {
     }
   };
 
+  const describeEvent = (event: any): string | null => {
+    switch (event.type) {
+      case 'round_start': return `ROUND ${event.round} STARTED`;
+      case 'round_skipped': return `ROUND ${event.round} SKIPPED (${event.reason})`;
+      case 'agent_result': return `${event.agent.toUpperCase()}: ${event.result.triage_level ?? (event.result.veto !== undefined ? `veto=${event.result.veto}` : 'done')}`;
+      case 'veto': return 'ETHICS VETO TRIGGERED';
+      case 'rule_decision': return `RULE GATE: ${event.decision} (${event.rule})`;
+      case 'error': return `ERROR: ${event.detail}`;
+      default: return null;
+    }
+  };
+
   return (
     <div className="relative min-h-screen font-sans">
       {/* PASTE THE BACKGROUND HERE - Top level, z-index managed by class */}
@@ -243,6 +281,21 @@ const App: React.FC = () => {
                   </div>
                 )}
               </div>
+            ) : loading && events.length > 0 ? (
+              // Live deliberation feed while the agents are still working
+              <div className="bg-[#020b1f]/60 border border-teal-900/40 p-5 rounded-2xl backdrop-blur-sm">
+                <h4 className="text-xs font-bold text-teal-400 uppercase tracking-widest mb-3 flex items-center gap-2">
+                  <Cpu className="w-4 h-4" /> Live Deliberation
+                </h4>
+                <ul className="space-y-2 font-mono text-xs text-slate-300">
+                  {events.map((event, i) => {
+                    const line = describeEvent(event);
+                    return line ? (
+                      <li key={i} className={event.type === 'veto' || event.type === 'error' ? 'text-red-400' : ''}>{line}</li>
+                    ) : null;
+                  })}
+                </ul>
+              </div>
             ) : (
               // Empty State Placeholder
               <div className="h-full bg-[#020b1f]/20 border border-slate-800/50 rounded-2xl border-dashed flex flex-col items-center justify-center p-12 text-center">
@@ -0,0 +1,69 @@
+import json
+import os
+import unittest
+from unittest.mock import AsyncMock, patch
+from fastapi.testclient import TestClient
+from backend.api import app
+from core.events import make_event
+
+class TestTriageAPI(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.dict(os.environ, {"OPENAI_API_KEY": "dummy"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_system_is_shared_across_requests(self):
+        payload = {"symptoms": "Headache", "age": "25", "history": "None"}
+
+        with TestClient(app) as client:
+            system = app.state.triage_system
+            system.run_simulation_async = AsyncMock(return_value={"final_decision": "CONSULT"})
+            system.aclose = AsyncMock()
+
+            for _ in range(3):
+                response = client.post("/api/triage", json=payload)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json()["final_decision"], "CONSULT")
+
+            self.assertIs(app.state.triage_system, system)
+            self.assertEqual(system.run_simulation_async.await_count, 3)
+
+        # Lifespan shutdown releases the shared connection pools
+        system.aclose.assert_awaited_once()
+
+    def test_stream_endpoint_sends_server_sent_events(self):
+        payload = {"symptoms": "Headache", "age": "25", "history": "None"}
+
+        async def fake_stream(inputs):
+            yield make_event("round_start", round=1)
+            yield make_event("final_decision", result={"final_decision": "CONSULT"})
+
+        with TestClient(app) as client:
+            app.state.triage_system.stream_simulation_async = fake_stream
+            response = client.post("/api/triage/stream", json=payload)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/event-stream"))
+        frames = [frame for frame in response.text.split("\n\n") if frame]
+        self.assertEqual(frames[0].splitlines()[0], "event: round_start")
+        self.assertEqual(json.loads(frames[-1].splitlines()[1][len("data: "):])["result"]["final_decision"], "CONSULT")
+
+    def test_batch_endpoint_streams_jsonl_results(self):
+        body = "\n".join(json.dumps({"id": str(i), "symptoms": "Headache", "age": "25"}) for i in range(5))
+
+        with TestClient(app) as client:
+            system = app.state.triage_system
+
+            async def fake_stream(inputs):
+                yield make_event("final_decision", result={"final_decision": "CONSULT"})
+
+            system.stream_simulation_async = fake_stream
+            response = client.post("/api/triage/batch?concurrency=2", content=body)
+
+        self.assertEqual(response.status_code, 200)
+        records = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual(sorted(record["id"] for record in records), ["0", "1", "2", "3", "4"])
+        self.assertTrue(all(record["result"]["final_decision"] == "CONSULT" for record in records))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from core.batch import completed_case_ids, read_cases, run_batch, run_batch_async
+from core.events import make_event
+
+class FakeSystem:
+    """Stands in for TriageSystem; fails any case whose symptoms say so."""
+    def __init__(self):
+        self.seen = []
+
+    def _events(self, inputs):
+        self.seen.append(inputs["symptoms"])
+        if inputs["symptoms"] == "fail":
+            raise RuntimeError("LLM unavailable")
+        return [make_event("round_start", round=1), make_event("final_decision", result={"final_decision": "CONSULT"})]
+
+    def stream_simulation(self, inputs):
+        yield from self._events(inputs)
+
+    async def stream_simulation_async(self, inputs):
+        for event in self._events(inputs):
+            yield event
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cases_path = os.path.join(self.tmp.name, "cases.jsonl")
+        self.output_path = os.path.join(self.tmp.name, "results.jsonl")
+        with open(self.cases_path, "w") as f:
+            f.write(json.dumps({"id": "a", "symptoms": "Headache", "age": "25"}) + "\n")
+            f.write(json.dumps({"symptoms": "fail", "age": "40"}) + "\n")
+            f.write("\n")
+            f.write(json.dumps({"id": "c", "symptoms": "Cough", "age": "60"}) + "\n")
+
+    def test_read_cases_assigns_line_ids(self):
+        ids = [case_id for case_id, _ in read_cases(self.cases_path)]
+        self.assertEqual(ids, ["a", "2", "c"])
+
+    def test_run_batch_writes_results_and_resumes(self):
+        system = FakeSystem()
+        summary = run_batch(system, read_cases(self.cases_path), self.output_path, max_concurrency=2)
+        self.assertEqual(summary, {"completed": 2, "failed": 1, "skipped": 0})
+        self.assertEqual(completed_case_ids(self.output_path), {"a", "c"})
+
+        # Only the failed case is retried on resume
+        rerun = FakeSystem()
+        summary = run_batch(rerun, read_cases(self.cases_path), self.output_path)
+        self.assertEqual(summary, {"completed": 0, "failed": 1, "skipped": 2})
+        self.assertEqual(rerun.seen, ["fail"])
+
+    def test_run_batch_async_yields_every_case(self):
+        async def cases():
+            for case in read_cases(self.cases_path):
+                yield case
+
+        async def collect():
+            return [record async for record in run_batch_async(FakeSystem(), cases(), max_concurrency=2)]
+
+        records = {record["id"]: record for record in asyncio.run(collect())}
+        self.assertEqual(records["a"]["result"]["final_decision"], "CONSULT")
+        self.assertEqual(records["2"]["error"], "LLM unavailable")
+        self.assertIn("c", records)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from core.decision_rules import evaluate_rules
+
+def round1(symptom=None, risk=None, evidence=None, ethics=None):
+    defaults = {
+        "symptom": {"triage_level": "consult", "risk_score": 40, "confidence": 80, "red_flags": []},
+        "risk": {"triage_level": "consult", "risk_score": 50, "confidence": 70, "red_flags": []},
+        "evidence": {"risk_score": 0, "confidence": 90, "red_flags": ["No vitals provided"]},
+        "ethics": {"triage_level": "consult", "risk_score": 45, "confidence": 75, "red_flags": []}
+    }
+    overrides = {"symptom": symptom, "risk": risk, "evidence": evidence, "ethics": ethics}
+    return {key: {**value, **(overrides[key] or {})} for key, value in defaults.items()}
+
+NO_REVIEW = {"risk_review": {"red_flags": []}, "ethics_review": {"veto": False}}
+
+class TestDecisionRules(unittest.TestCase):
+    def test_no_rule_fires_for_borderline_case(self):
+        # Evidence "red flags" are missing information, not clinical flags
+        self.assertIsNone(evaluate_rules(round1(), NO_REVIEW))
+
+    def test_red_flags_are_urgent_and_deduplicated(self):
+        decision = evaluate_rules(
+            round1(symptom={"red_flags": ["Stiff neck"]}),
+            {"risk_review": {"red_flags": ["stiff neck "]}, "ethics_review": {"veto": True}}
+        )
+        self.assertEqual(decision["final_decision"], "URGENT")
+        self.assertEqual(decision["safety_notes"], ["Stiff neck"])
+
+    def test_refusal_rules(self):
+        vetoed = evaluate_rules(round1(), {"risk_review": {}, "ethics_review": {"veto": True}})
+        self.assertEqual(vetoed["rule"], "ethics_veto")
+
+        unsure = evaluate_rules(round1(symptom={"confidence": 10}, risk={"confidence": 20}, evidence={"confidence": 30}, ethics={"confidence": 30}), NO_REVIEW)
+        self.assertEqual((unsure["final_decision"], unsure["rule"]), ("REFUSED", "low_confidence"))
+
+        split = evaluate_rules(round1(symptom={"risk_score": 10}, risk={"risk_score": 90}), NO_REVIEW)
+        self.assertEqual((split["final_decision"], split["rule"]), ("REFUSED", "disagreement"))
+
+    def test_high_average_risk_is_consult(self):
+        decision = evaluate_rules(round1(symptom={"risk_score": 75}, risk={"risk_score": 85}, ethics={"risk_score": 80}), NO_REVIEW)
+        self.assertEqual(decision["final_decision"], "CONSULT")
+
+    def test_failed_agent_call_defers_to_coordinator(self):
+        self.assertIsNone(evaluate_rules(round1(risk={"error": "timeout", "red_flags": ["x"]}), NO_REVIEW))
+
+if __name__ == '__main__':
+    unittest.main()
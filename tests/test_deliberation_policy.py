@@ -0,0 +1,37 @@
+import unittest
+from core.deliberation_policy import DeliberationPolicy
+
+def round1(level, confidence, red_flags=(), ethics_veto=False):
+    outputs = {
+        key: {"triage_level": level, "confidence": confidence, "red_flags": list(red_flags)}
+        for key in ("symptom", "risk", "ethics")
+    }
+    outputs["evidence"] = {"triage_level": "unknown", "confidence": 90}
+    outputs["ethics"]["veto"] = ethics_veto
+    return outputs
+
+class TestDeliberationPolicy(unittest.TestCase):
+    def setUp(self):
+        self.policy = DeliberationPolicy()
+
+    def test_unanimous_urgent_with_red_flags_skips(self):
+        self.assertEqual(self.policy.skip_round2_reason(round1("urgent", 50, ["Chest pain"])), "unanimous_urgent")
+
+    def test_confident_agreement_skips(self):
+        self.assertEqual(self.policy.skip_round2_reason(round1("consult", 85)), "confident_agreement")
+
+    def test_self_care_and_vetoes_keep_ethics_review(self):
+        self.assertIsNone(self.policy.skip_round2_reason(round1("self-care", 95)))
+        self.assertIsNone(self.policy.skip_round2_reason(round1("urgent", 95, ["Chest pain"], ethics_veto=True)))
+
+    def test_disagreement_or_low_confidence_runs_round2(self):
+        outputs = round1("consult", 85)
+        outputs["risk"]["triage_level"] = "urgent"
+        self.assertIsNone(self.policy.skip_round2_reason(outputs))
+        self.assertIsNone(self.policy.skip_round2_reason(round1("consult", 60)))
+
+    def test_always_mode_never_skips(self):
+        self.assertIsNone(DeliberationPolicy(mode="always").skip_round2_reason(round1("urgent", 99, ["Chest pain"])))
+
+if __name__ == '__main__':
+    unittest.main()
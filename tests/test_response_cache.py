@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from utils.llm_client import LLMClient
+from utils.response_cache import MemoryResponseCache, SQLiteResponseCache, make_cache_key
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class TestResponseCache(unittest.TestCase):
+    def test_key_ignores_whitespace_only_differences(self):
+        a = make_cache_key("gpt-4o", "  You are an agent.\n", "Case:\n  headache")
+        b = make_cache_key("gpt-4o", "You are an agent.", "Case: headache")
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, make_cache_key("gpt-4o-mini", "You are an agent.", "Case: headache"))
+
+    def test_memory_cache_lru_and_ttl(self):
+        clock = FakeClock()
+        cache = MemoryResponseCache(max_entries=2, ttl_seconds=10, clock=clock)
+        cache.set("a", {"v": 1})
+        cache.set("b", {"v": 2})
+        cache.get("a")  # a becomes most recently used
+        cache.set("c", {"v": 3})
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), {"v": 1})
+
+        clock.now += 11
+        self.assertIsNone(cache.get("c"))
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.stats()["misses"], 2)
+
+    def test_sqlite_cache_persists_across_instances(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.db")
+            cache = SQLiteResponseCache(path, max_entries=1)
+            cache.set("a", {"v": 1})
+            cache.set("b", {"v": 2})
+            cache.close()
+
+            reopened = SQLiteResponseCache(path)
+            self.assertIsNone(reopened.get("a"))
+            self.assertEqual(reopened.get("b"), {"v": 2})
+            reopened.close()
+
+class TestLLMClientCaching(unittest.TestCase):
+    def setUp(self):
+        self.client = LLMClient(api_key="dummy", cache=MemoryResponseCache())
+        response = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content='{"triage_level": "consult"}'))])
+        self.client.client = MagicMock()
+        self.client.client.chat.completions.create.return_value = response
+
+    def test_repeat_prompts_hit_cache_and_return_copies(self):
+        first = self.client.generate("system", "user")
+        first["recommended_doctors"] = []
+        second = self.client.generate("system", "  user ")
+
+        self.assertEqual(second, {"triage_level": "consult"})
+        self.assertEqual(self.client.client.chat.completions.create.call_count, 1)
+
+    def test_use_cache_false_bypasses_cache(self):
+        self.client.generate("system", "user")
+        self.client.generate("system", "user", use_cache=False)
+        self.assertEqual(self.client.client.chat.completions.create.call_count, 2)
+
+    def test_errors_are_not_cached(self):
+        self.client.client.chat.completions.create.side_effect = [RuntimeError("boom"), self.client.client.chat.completions.create.return_value]
+        self.assertIn("error", self.client.generate("system", "user"))
+        self.assertEqual(self.client.generate("system", "user"), {"triage_level": "consult"})
+
+if __name__ == '__main__':
+    unittest.main()
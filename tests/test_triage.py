@@ -1,6 +1,8 @@
+import asyncio
 import unittest
 from unittest.mock import MagicMock
 from core.triage_system import TriageSystem
+from core.deliberation_policy import DeliberationPolicy
 from utils.llm_client import LLMClient
 
 class TestTriageSystem(unittest.TestCase):
@@ -52,6 +54,7 @@ class TestTriageSystem(unittest.TestCase):
             return {}
 
         self.mock_client.generate.side_effect = generate_side_effect
+        self.mock_client.generate_async.side_effect = generate_side_effect
         
         # Initialize system with mocked client injection
         # Note: TriageSystem creates its own client. We need to patch it or inject it.
@@ -65,7 +68,7 @@ class TestTriageSystem(unittest.TestCase):
         self.system.risk_agent.client = self.mock_client
         self.system.evidence_agent.client = self.mock_client
         self.system.ethics_agent.client = self.mock_client
-        self.system.coordinator_agent.client = self.mock_client
+        self.system.coordinator.client = self.mock_client
 
     def test_run_simulation(self):
         inputs = {"symptoms": "Headache", "age": "25"}
@@ -79,5 +82,93 @@ class TestTriageSystem(unittest.TestCase):
         # Total 7 calls
         self.assertEqual(self.mock_client.generate.call_count, 7)
 
+    def test_sequential_mode_matches_concurrent(self):
+        inputs = {"symptoms": "Headache", "age": "25"}
+        concurrent_result = self.system.run_simulation(inputs)
+
+        self.system.max_concurrency = 1
+        sequential_result = self.system.run_simulation(inputs)
+
+        self.assertEqual(concurrent_result, sequential_result)
+        self.assertEqual(self.mock_client.generate.call_count, 14)
+
+    def test_run_simulation_async(self):
+        inputs = {"symptoms": "Headache", "age": "25"}
+        result = asyncio.run(self.system.run_simulation_async(inputs))
+
+        self.assertEqual(result, self.system.run_simulation(inputs))
+        # Same 7-call contract, but every call is awaited instead of blocking
+        self.assertEqual(self.mock_client.generate_async.await_count, 7)
+        self.assertEqual(self.mock_client.generate.call_count, 7)
+
+    def _add_symptom_red_flag(self):
+        base_side_effect = self.mock_client.generate.side_effect
+
+        def side_effect(system_prompt, user_prompt, **kwargs):
+            result = base_side_effect(system_prompt, user_prompt, **kwargs)
+            if "Symptom Interpretation Agent" in system_prompt:
+                result["red_flags"] = ["Stiff neck"]
+            return result
+
+        self.mock_client.generate.side_effect = side_effect
+
+    def test_rule_gate_skips_coordinator_on_red_flags(self):
+        self._add_symptom_red_flag()
+        result = self.system.run_simulation({"symptoms": "Headache, stiff neck", "age": "25"})
+
+        self.assertEqual(result["final_decision"], "URGENT")
+        self.assertEqual(result["decision_source"], "rules")
+        self.assertTrue(result["recommended_doctors"])
+        self.assertEqual(self.mock_client.generate.call_count, 6)
+
+    def test_rule_gate_narrative_keeps_rule_decision(self):
+        self._add_symptom_red_flag()
+        self.system.narrate_rule_decisions = True
+        result = self.system.run_simulation({"symptoms": "Headache, stiff neck", "age": "25"})
+
+        # The mocked Coordinator says CONSULT, but the rules already fixed URGENT
+        self.assertEqual(result["final_decision"], "URGENT")
+        self.assertEqual(result["reasoning_summary"], "Symptoms suggest mild infection.")
+        self.assertEqual(self.mock_client.generate.call_count, 7)
+
+    def _make_round1_confident(self):
+        base_side_effect = self.mock_client.generate.side_effect
+
+        def side_effect(system_prompt, user_prompt, **kwargs):
+            result = base_side_effect(system_prompt, user_prompt, **kwargs)
+            if "review_target" not in user_prompt and "Coordinator Agent" not in system_prompt:
+                result["confidence"] = 90
+            return result
+
+        self.mock_client.generate.side_effect = side_effect
+
+    def test_adaptive_policy_skips_round2_for_confident_agreement(self):
+        self._make_round1_confident()
+        result = self.system.run_simulation({"symptoms": "Headache", "age": "25"})
+
+        self.assertEqual(result["final_decision"], "CONSULT")
+        self.assertEqual(result["deliberation"], {"path": "round1_only", "reason": "confident_agreement"})
+        # 4 Round 1 calls + Coordinator
+        self.assertEqual(self.mock_client.generate.call_count, 5)
+
+    def test_always_policy_keeps_round2(self):
+        self._make_round1_confident()
+        self.system.deliberation_policy = DeliberationPolicy(mode="always")
+        result = self.system.run_simulation({"symptoms": "Headache", "age": "25"})
+
+        self.assertEqual(result["deliberation"]["path"], "full")
+        self.assertEqual(self.mock_client.generate.call_count, 7)
+
+    def test_stream_simulation_emits_structured_events(self):
+        events = list(self.system.stream_simulation({"symptoms": "Headache", "age": "25"}))
+        types = [event["type"] for event in events]
+
+        self.assertEqual(types[0], "round_start")
+        self.assertEqual(types[-1], "final_decision")
+        self.assertEqual(events[-1]["result"]["final_decision"], "CONSULT")
+        agents = sorted(event["agent"] for event in events if event["type"] == "agent_result")
+        self.assertEqual(agents, ["coordinator", "ethics", "ethics_review", "evidence", "risk", "risk_review", "symptom"])
+        self.assertEqual([event["round"] for event in events if event["type"] == "round_start"], [1, 2, 3])
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,50 +1,148 @@
 import os
 import json
 from typing import Dict, Any, Optional
-from openai import OpenAI
+import httpx
+from openai import OpenAI, AsyncOpenAI, DefaultHttpxClient, DefaultAsyncHttpxClient
 from dotenv import load_dotenv
+from utils.response_cache import ResponseCache, make_cache_key
 
 load_dotenv()
 
+GROQ_BASE_URL = "https://api.groq.com/openai/v1"
+
 class LLMClient:
-    def __init__(self, api_key: Optional[str] = None):
+    """
+    Thread-safe wrapper around the OpenAI SDK. One instance is meant to be shared
+    by every agent (and every concurrent request) so they reuse the same
+    keep-alive connection pool instead of paying a TLS handshake per case.
+    """
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 120.0,
+        timeout: float = 60.0,
+        connect_timeout: float = 5.0,
+        cache: Optional[ResponseCache] = None
+    ):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.cache = cache
         self.is_groq = False
         
         if not self.api_key:
             print("WARNING: No API key found. System will fail if real LLM calls are attempted.")
             self.client = None
+            self.async_client = None
         else:
+            base_url = None
             if self.api_key.startswith("gsk_"):
                 self.is_groq = True
-                self.client = OpenAI(
-                    api_key=self.api_key,
-                    base_url="https://api.groq.com/openai/v1"
-                )
-            else:
-                self.client = OpenAI(api_key=self.api_key)
-
-    def generate(self, system_prompt: str, user_prompt: str, model: str = "gpt-4o", json_mode: bool = True) -> Dict[str, Any]:
-        if not self.client:
-            raise ValueError("LLM Client not initialized with an API key.")
+                base_url = GROQ_BASE_URL
+
+            limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            )
+            http_timeout = httpx.Timeout(timeout, connect=connect_timeout)
+            self.client = OpenAI(
+                api_key=self.api_key,
+                base_url=base_url,
+                http_client=DefaultHttpxClient(limits=limits, timeout=http_timeout)
+            )
+            # Separate async client so FastAPI handlers never block the event loop.
+            self.async_client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=base_url,
+                http_client=DefaultAsyncHttpxClient(limits=limits, timeout=http_timeout)
+            )
 
+    def close(self) -> None:
+        """
+        Releases the sync connection pool. The async pool needs aclose().
+        """
+        if self.client:
+            self.client.close()
+
+    async def aclose(self) -> None:
+        """
+        Releases both connection pools.
+        """
+        self.close()
+        if self.async_client:
+            await self.async_client.close()
+
+    def _resolve_model(self, model: str) -> str:
         # Adjust model for Groq if necessary
         if self.is_groq and "gpt" in model:
-            model = "llama-3.3-70b-versatile"
+            return "llama-3.3-70b-versatile"
+        return model
+
+    def _request(self, system_prompt: str, user_prompt: str, model: str, json_mode: bool) -> Dict[str, Any]:
+        return {
+            "model": self._resolve_model(model),
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "response_format": {"type": "json_object"} if json_mode else None
+        }
+
+    def _parse(self, response: Any, json_mode: bool) -> Any:
+        content = response.choices[0].message.content
+        if json_mode:
+            return json.loads(content)
+        return content
+
+    def _cache_key(self, system_prompt: str, user_prompt: str, model: str, json_mode: bool, use_cache: bool) -> Optional[str]:
+        if self.cache is None or not use_cache:
+            return None
+        return make_cache_key(self._resolve_model(model), system_prompt, user_prompt, json_mode)
+
+    def _store(self, key: Optional[str], result: Any) -> None:
+        # Failed calls are never cached, so a retry really goes back to the provider.
+        if key and not (isinstance(result, dict) and "error" in result):
+            self.cache.set(key, result)
+
+    def generate(self, system_prompt: str, user_prompt: str, model: str = "gpt-4o", json_mode: bool = True, use_cache: bool = True) -> Dict[str, Any]:
+        if not self.client:
+            raise ValueError("LLM Client not initialized with an API key.")
+
+        key = self._cache_key(system_prompt, user_prompt, model, json_mode, use_cache)
+        if key:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
 
         try:
             response = self.client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                response_format={"type": "json_object"} if json_mode else None
+                **self._request(system_prompt, user_prompt, model, json_mode)
+            )
+            result = self._parse(response, json_mode)
+        except Exception as e:
+            print(f"Error calling LLM: {e}")
+            return {"error": str(e)}
+        self._store(key, result)
+        return result
+
+    async def generate_async(self, system_prompt: str, user_prompt: str, model: str = "gpt-4o", json_mode: bool = True, use_cache: bool = True) -> Dict[str, Any]:
+        if not self.async_client:
+            raise ValueError("LLM Client not initialized with an API key.")
+
+        key = self._cache_key(system_prompt, user_prompt, model, json_mode, use_cache)
+        if key:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        try:
+            response = await self.async_client.chat.completions.create(
+                **self._request(system_prompt, user_prompt, model, json_mode)
             )
-            content = response.choices[0].message.content
-            if json_mode:
-                return json.loads(content)
-            return content
+            result = self._parse(response, json_mode)
         except Exception as e:
             print(f"Error calling LLM: {e}")
             return {"error": str(e)}
+        self._store(key, result)
+        return result
@@ -0,0 +1,193 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+def canonicalize_prompt(prompt: str) -> str:
+    """
+    Collapses whitespace so prompts that only differ in indentation or
+    line breaks (e.g. triple-quoted templates, pasted symptoms) share a key.
+    """
+    return " ".join(prompt.split())
+
+def make_cache_key(model: str, system_prompt: str, user_prompt: str, json_mode: bool = True) -> str:
+    """
+    Content address of an LLM call: sha256 over the model, both prompts and the output mode.
+    """
+    payload = json.dumps([
+        model,
+        canonicalize_prompt(system_prompt),
+        canonicalize_prompt(user_prompt),
+        json_mode
+    ])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class ResponseCache(ABC):
+    """
+    Stores LLM responses by content address. Values are kept serialized, so every
+    hit hands out a fresh object that callers may mutate freely.
+    """
+    def __init__(self, ttl_seconds: Optional[float] = 3600.0, clock: Callable[[], float] = time.time):
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def _set(self, key: str, value: str) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds is not None and self.clock() - created_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self._get(key)
+        with self._stats_lock:
+            if raw is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any) -> None:
+        self._set(key, json.dumps(value))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self)
+            }
+
+class MemoryResponseCache(ResponseCache):
+    """
+    In-process LRU with a per-entry TTL.
+    """
+    def __init__(self, max_entries: int = 1024, **kwargs):
+        super().__init__(**kwargs)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            created_at, value = entry
+            if self._expired(created_at):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (self.clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    On-disk cache that survives restarts and can be shared by several processes.
+    Evicts least recently used rows once max_entries is exceeded.
+    """
+    def __init__(self, path: str, max_entries: int = 100_000, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)")
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            with self._conn:
+                if self._expired(created_at):
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    return None
+                self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (self.clock(), key))
+            return value
+
+    def _set(self, key: str, value: str) -> None:
+        now = self.clock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now, now)
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+def build_response_cache(spec: Optional[str] = None) -> Optional[ResponseCache]:
+    """
+    Builds a cache from a short spec, defaulting to the TRIAGE_CACHE env var:
+    "off" (or empty), "memory", or "sqlite:<path>". TTL comes from TRIAGE_CACHE_TTL.
+    """
+    spec = (spec if spec is not None else os.getenv("TRIAGE_CACHE", "")).strip()
+    ttl = float(os.getenv("TRIAGE_CACHE_TTL", "3600"))
+    if not spec or spec == "off":
+        return None
+    if spec == "memory":
+        return MemoryResponseCache(ttl_seconds=ttl)
+    if spec.startswith("sqlite:"):
+        return SQLiteResponseCache(spec[len("sqlite:"):], ttl_seconds=ttl)
+    raise ValueError(f"Unknown cache spec: {spec}")